@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import logging
+import mmap
+import os
+import re
 import warnings
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -39,6 +42,7 @@ SENSOR_LABELS = (  # these might need modifications if sensors are edited
     "R.Tib.Ant.",
 )
 ACCELERATION_SUFFIXES = (":X", ":Y", ":Z")
+_WS_RE = re.compile(r"\s+")
 
 
 class RecordingInfo:
@@ -61,16 +65,20 @@ class RecordingInfo:
         Duration of recording.
     """
 
-    def __init__(self, data: pd.DataFrame):
-        time: Sequence[datetime] = data.index  # type: ignore
-        period = (time[1] - time[0]).total_seconds()
-
-        self.fs: float = 1 / period
-        self.samples: int = len(data)
-        self.channels: list[str] = list(data.columns)
-        self.start_time: datetime = time[0]
-        self.end_time: datetime = time[-1]
-        self.duration: timedelta = self.end_time - self.start_time
+    def __init__(
+        self,
+        fs: float,
+        samples: int,
+        channels: list[str],
+        start_time: datetime,
+        end_time: datetime,
+    ):
+        self.fs = fs
+        self.samples = samples
+        self.channels = channels
+        self.start_time = start_time
+        self.end_time = end_time
+        self.duration: timedelta = end_time - start_time
 
     def __repr__(self) -> str:
         return (
@@ -83,6 +91,11 @@ class RecordingInfo:
     def from_file(cls, file: str | PathLike) -> RecordingInfo:
         """Get the recording info of a given .c3d file.
 
+        Only the header of the file is read, so this is much faster than
+        loading the recording with `load_data` first. Note that the number
+        of samples includes the trailing zero-padding that `load_data`
+        trims away.
+
         Parameters
         ----------
         file : str | PathLike
@@ -93,13 +106,27 @@ class RecordingInfo:
         RecordingInfo
             The information of the recording.
         """
-        data = load_data(file)
-        return cls(data)
+        with open(file, "rb", buffering=1 << 20) as c3dfile:
+            reader = c3d.Reader(c3dfile)
+            rate = float(reader.analog_rate)
+            samples = reader.frame_count * reader.analog_per_frame
+            labels = [_WS_RE.sub(" ", label.strip()) for label in reader.analog_labels]
+
+        # same start/end logic as generate_timestamps, without the data
+        duration = timedelta(seconds=(samples - 1) / rate)
+        end_time = datetime.fromtimestamp(Path(file).stat().st_mtime)
+
+        return cls(
+            fs=rate,
+            samples=samples,
+            channels=labels,
+            start_time=end_time - duration,
+            end_time=end_time,
+        )
 
     @classmethod
     def from_data(cls, data: pd.DataFrame) -> RecordingInfo:
         """Get the recording info of data already loaded.
-        This is equivalent to instanciating the class directly.
 
         Parameters
         ----------
@@ -111,7 +138,16 @@ class RecordingInfo:
         RecordingInfo
             The information of the recording.
         """
-        return cls(data)
+        time: Sequence[datetime] = data.index  # type: ignore
+        period = (time[1] - time[0]).total_seconds()
+
+        return cls(
+            fs=1 / period,
+            samples=len(data),
+            channels=list(data.columns),
+            start_time=time[0],
+            end_time=time[-1],
+        )
 
 
 def generate_timestamps(
@@ -155,23 +191,34 @@ def generate_timestamps(
     _log.debug(f"Recording duration is {dur} seconds")
     _log.debug(f"Sample frequency is {1/T} Hz")
 
-    # Generate timestamp for each datapoint
+    # Generate timestamp for each datapoint, directly from int64 nanoseconds
+    # to stay on the vectorized NumPy path
     _log.debug("Generating timestamps...")
-    timestamps = pd.date_range(
-        start=time_started,
-        periods=len(time),
-        freq=timedelta(seconds=T),
+    period_ns = int(round(T * 1e9))
+    start_ns = pd.Timestamp(time_started).value
+    timestamps = pd.DatetimeIndex(
+        start_ns + np.arange(len(time), dtype=np.int64) * period_ns,
+        name="Timestamps",
     )
-    timestamps.name = "Timestamps"
     _log.debug("Success!")
 
     return timestamps
 
 
-def downsample(data: pd.DataFrame, *, ratio: int) -> pd.DataFrame:
+def downsample(
+    data: pd.DataFrame, *, ratio: int, copy: bool = False, antialias: bool = False
+) -> pd.DataFrame:
     """Downsample the data to every `ratio` values.
     ratio=2 means keep half of the data, 3 keep only the third.
 
+    By default the result is a view on the original data, so no copy of
+    the signal is made; mutating the result can affect the original
+    DataFrame. Pass copy=True to get an independent copy.
+
+    Bare subsampling folds any frequency content above the new Nyquist
+    frequency back into the result; pass antialias=True to low-pass
+    filter the signals before decimating (requires scipy).
+
     Parameters
     ----------
     data : pandas.DataFrame
@@ -179,14 +226,41 @@ def downsample(data: pd.DataFrame, *, ratio: int) -> pd.DataFrame:
     ratio : int
         The ratio of the data to keep. 2 means keep half of the data (1/2),
         3 means keep only one value every three (1/3).
+    copy : bool, optional
+        If the result should be an independent copy of the data instead of
+        a view, by default False.
+    antialias : bool, optional
+        If an anti-aliasing filter should be applied before decimating,
+        by default False.
 
     Returns
     -------
     pandas.DataFrame
         The downsampled DataFrame
+
+    Raises
+    ------
+    ImportError
+        antialias=True was requested but scipy is not installed.
     """
-    downsampled_data = data.iloc[::ratio, :].copy()
-    return downsampled_data
+    if antialias:
+        try:
+            from scipy import signal
+        except ImportError:
+            raise ImportError(
+                "scipy is required for downsample(..., antialias=True)"
+            ) from None
+
+        filtered = signal.decimate(data.to_numpy(), ratio, axis=0, zero_phase=True)
+        return pd.DataFrame(
+            filtered,
+            index=data.index[::ratio][: len(filtered)],
+            columns=data.columns,
+            copy=False,
+        )
+
+    downsampled_data = data.iloc[::ratio, :]
+    return downsampled_data.copy() if copy else downsampled_data
 
 
 def extract_emg_data(data: pd.DataFrame) -> pd.DataFrame:
@@ -203,8 +277,8 @@ def extract_emg_data(data: pd.DataFrame) -> pd.DataFrame:
     pandas.DataFrame
         A DataFrame with only the EMG data.
     """
-    emg_cols = [c for c in data.columns if not c.endswith(ACCELERATION_SUFFIXES)]
-    return data[emg_cols]
+    mask = data.columns.str.endswith(ACCELERATION_SUFFIXES)
+    return data.loc[:, ~mask]
 
 
 def extract_acceleration_data(data: pd.DataFrame) -> pd.DataFrame:
@@ -221,8 +295,8 @@ def extract_acceleration_data(data: pd.DataFrame) -> pd.DataFrame:
     pandas.DataFrame
         A DataFrame with only the acceleration data.
     """
-    accel_cols = [c for c in data.columns if c.endswith(ACCELERATION_SUFFIXES)]
-    return data[accel_cols]
+    mask = data.columns.str.endswith(ACCELERATION_SUFFIXES)
+    return data.loc[:, mask]
 
 
 def load_data(file: str | PathLike) -> pd.DataFrame:
@@ -246,25 +320,42 @@ def load_data(file: str | PathLike) -> pd.DataFrame:
         The file provided is not a .c3d file.
     """
     _log.debug(f"reading file {file}")
-    if Path(file).suffix.lower() != ".c3d":
+    # plain string check; cheaper than building a Path just for the suffix
+    if not os.fspath(file).lower().endswith(".c3d"):
         raise ValueError(f"{file} is not a .c3d file")
 
-    with open(file, "rb") as c3dfile:
+    # memory-map the file so the reader's many small frame reads become
+    # plain page-cache accesses instead of buffered syscalls
+    with open(file, "rb") as fh, mmap.mmap(
+        fh.fileno(), 0, access=mmap.ACCESS_READ
+    ) as c3dfile:
         frames = c3d.Reader(c3dfile)
-        analog_samples = []
+        # preallocate the full output buffer instead of accumulating
+        # per-frame copies in a list and concatenating at the end
+        n_analog = frames.analog_per_frame
+        all_analog_samples = np.empty(
+            (frames.frame_count * n_analog, frames.analog_used),
+            dtype=np.float32,  # matches the on-disk precision, halves memory
+        )
+        row = 0
         for i, points, analog in frames.read_frames():
-            analog_transposed = np.array(analog).T
-            analog_samples.append(analog_transposed)
-
-    # Concatenate the samples stored in frames
-    all_analog_samples = np.concatenate(analog_samples, axis=0)
-
-    # Convert to dataframe
-    data = pd.DataFrame(all_analog_samples, columns=frames.analog_labels)
-    data.columns = data.columns.str.strip().str.replace(r"\s+", " ", regex=True)
+            all_analog_samples[row : row + n_analog] = np.asarray(
+                analog, dtype=np.float32
+            ).T
+            row += n_analog
+
+    # Convert to dataframe, wrapping the buffer without a defensive copy
+    data = pd.DataFrame(
+        all_analog_samples, columns=list(frames.analog_labels), copy=False
+    )
+    data.columns = pd.Index([_WS_RE.sub(" ", c.strip()) for c in data.columns])
 
-    # Remove zero-padding
-    data = data.apply(lambda x: np.trim_zeros(x, "b"), axis=0)  # 'b' to trim from back
+    # Remove zero-padding: find the last row with any non-zero value and
+    # slice once, instead of trimming each column in a Python loop
+    nonzero_rows = np.any(all_analog_samples != 0, axis=1)
+    if nonzero_rows.any():
+        last = len(nonzero_rows) - np.argmax(nonzero_rows[::-1])
+        data = data.iloc[:last]
 
     # Generate time axis (units = seconds) as in EMG and Motion Tools software
     T = 1 / frames.analog_rate  # period in seconds
@@ -274,6 +365,5 @@ def load_data(file: str | PathLike) -> pd.DataFrame:
     # Generate timestamps
     timestamps = generate_timestamps(file, time)  # type: ignore
     data.index = timestamps
-    data.index = pd.to_datetime(data.index, format=DATETIME_FORMAT)
 
     return data
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import itertools
+import functools
 import logging
 import re
 from typing import TYPE_CHECKING
@@ -10,7 +10,17 @@ import numpy as np
 import pandas as pd
 from matplotlib import pyplot as plt
 
-from ._data import SENSOR_LABELS, extract_acceleration_data, extract_emg_data
+from ._data import (
+    ACCELERATION_SUFFIXES,
+    SENSOR_LABELS,
+    extract_acceleration_data,
+    extract_emg_data,
+)
+
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+except ImportError:  # optional dependency, fall back to plain striding
+    MinMaxLTTBDownsampler = None
 
 __all__ = [
     "plot_emg",
@@ -43,6 +53,11 @@ COMETA_COLORS = {
 }
 
 
+_COORD_RE = re.compile(r"\s\:(X|Y|Z)")
+_SENSOR_ORDER = {sensor: i for i, sensor in enumerate(SENSOR_LABELS)}
+
+
+@functools.lru_cache(maxsize=None)
 def _clean_sensor_label(sensor_label: str) -> str:
     """Remove the coordinate prefix of the sensor labels, if present.
 
@@ -56,7 +71,56 @@ def _clean_sensor_label(sensor_label: str) -> str:
     clean_label: str
         The label without the coordinate prefix.
     """
-    return re.sub(r"\s\:(X|Y|Z)", "", sensor_label)
+    return _COORD_RE.sub("", sensor_label)
+
+
+def _decimate_for_plot(data: pd.DataFrame, max_points: int | None) -> pd.DataFrame:
+    """Reduce the data to roughly `max_points` rows per channel before
+    plotting. Screens only have a few thousand pixels of width, so rendering
+    every raw sample through matplotlib is wasted work on long recordings.
+
+    If `tsdownsample` is installed, a MinMaxLTTB downsampling is used to
+    preserve the peak envelope of each channel; since each channel selects
+    its own rows, the union can keep up to `max_points` rows per column.
+    Otherwise every nth row is kept, for at most `max_points` rows total.
+
+    Parameters
+    ----------
+    data : `pandas.DataFrame`
+        The Cometa data loaded from `cometa.load_data`, with possibly selected
+        columns.
+    max_points : int | None
+        The target number of rows to keep per channel. None disables
+        decimation.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The data, decimated if it was longer than `max_points`.
+    """
+    if max_points is None or len(data) <= max_points:
+        return data
+
+    if MinMaxLTTBDownsampler is not None:
+        x = data.index.to_numpy().view("i8")
+        indices = np.unique(
+            np.concatenate(
+                [
+                    MinMaxLTTBDownsampler().downsample(
+                        # column views of the zero-copy frames are not
+                        # contiguous, and the downsampler rejects those
+                        x,
+                        np.ascontiguousarray(data[col].to_numpy()),
+                        n_out=max_points,
+                    )
+                    for col in data.columns
+                ]
+            )
+        )
+        return data.iloc[indices]
+
+    stride = -(len(data) // -max_points)  # ceiling division
+    return data.iloc[::stride]
 
 
 def _make_stacked_figure(data: pd.DataFrame) -> tuple[Figure, list[Axes]]:
@@ -90,11 +154,17 @@ def _make_stacked_figure(data: pd.DataFrame) -> tuple[Figure, list[Axes]]:
     axes[-1].xaxis.set_major_formatter(mdates.DateFormatter("%H:%M:%S"))
     axes[-1].set_xlabel("Time (HH:MM:SS)")
 
-    for sensor, ax in zip(data.columns, axes):
-        sensor_clean = _clean_sensor_label(sensor)
-        _log.debug(sensor_clean)
+    clean_labels = {col: _clean_sensor_label(col) for col in data.columns}
+
+    # extract the underlying arrays once so matplotlib does not re-convert
+    # the DatetimeIndex and each Series for every subplot
+    x = data.index.to_numpy()
+    y = data.to_numpy()
+
+    for i, (sensor, ax) in enumerate(zip(data.columns, axes)):
+        _log.debug(clean_labels[sensor])
         ax.margins(x=0)
-        ax.plot(data[sensor], color=COMETA_COLORS[sensor_clean])
+        ax.plot(x, y[:, i], color=COMETA_COLORS[clean_labels[sensor]])
         ax.set_ylabel(sensor, rotation=0, labelpad=40)
 
     recording_start: datetime = data.index[0]
@@ -123,6 +193,8 @@ def _make_stacked_figure(data: pd.DataFrame) -> tuple[Figure, list[Axes]]:
 
 def _acceleration_norm(data: pd.DataFrame) -> pd.DataFrame:
     """Compute the norm of the acceleration of the different sensors.
+    Non-acceleration columns are ignored, so the full Cometa DataFrame can
+    be passed directly without extracting the acceleration data first.
 
     Parameters
     ----------
@@ -135,26 +207,37 @@ def _acceleration_norm(data: pd.DataFrame) -> pd.DataFrame:
     vector_norm: `pandas.DataFrame`
         A DataFrame with the vector norm of every sensor.
     """
-    vector_norm = pd.DataFrame()
-    for key, group in itertools.groupby(
-        sorted(
-            data.columns,
-            key=lambda s: SENSOR_LABELS.index(_clean_sensor_label(s)),
-        ),
-        key=_clean_sensor_label,
-    ):
-        vector_norm[key] = np.sqrt(np.square(data[list(group)]).sum(axis=1))
+    accel_cols = data.columns[data.columns.str.endswith(ACCELERATION_SUFFIXES)]
 
-    return vector_norm
+    # order the columns so the X, Y and Z components of each sensor are
+    # contiguous, then compute all the norms in a single vectorized pass
+    ordered = sorted(
+        accel_cols,
+        key=lambda s: (_SENSOR_ORDER[_clean_sensor_label(s)], s[-1]),
+    )
+    # einsum fuses the square and the sum over components in one pass,
+    # without materializing an intermediate squared array
+    xyz = data[ordered].to_numpy().reshape(len(data), -1, 3)
+    norms = np.sqrt(np.einsum("ijk,ijk->ij", xyz, xyz))
+
+    return pd.DataFrame(
+        norms,
+        index=data.index,
+        columns=[_clean_sensor_label(c) for c in ordered[::3]],
+        copy=False,
+    )
 
 
-def plot_emg(data: pd.DataFrame) -> Figure:
+def plot_emg(data: pd.DataFrame, *, max_points: int | None = 5000) -> Figure:
     """Plot the EMG data from a Cometa DataFrame.
 
     Parameters
     ----------
     data : `pandas.DataFrame`
         The Cometa data loaded from `cometa.load_data`.
+    max_points : int | None, optional
+        The maximum number of data points to draw per channel, by default
+        5000. Pass None to plot every raw sample.
 
     Returns
     -------
@@ -163,6 +246,7 @@ def plot_emg(data: pd.DataFrame) -> Figure:
     """
     # make sure only the EMG data is present
     emg_data = extract_emg_data(data)
+    emg_data = _decimate_for_plot(emg_data, max_points)
 
     fig, _ = _make_stacked_figure(emg_data)
     fig.suptitle("EMG Data ($\\mu$V)")
@@ -172,7 +256,9 @@ def plot_emg(data: pd.DataFrame) -> Figure:
     return fig
 
 
-def plot_acceleration(data: pd.DataFrame, *, norm: bool = True) -> Figure:
+def plot_acceleration(
+    data: pd.DataFrame, *, norm: bool = True, max_points: int | None = 5000
+) -> Figure:
     """Plot the acceleration from a Cometa DataFrame.
     If norm=True (the default), calculate the norm of the acceleration vectors
     for each sensors (the X, Y and Z components) and plot that.
@@ -184,20 +270,25 @@ def plot_acceleration(data: pd.DataFrame, *, norm: bool = True) -> Figure:
     norm : bool, optional
         If we should compute the norm of the acceleration vectors from
         components, by default True.
+    max_points : int | None, optional
+        The maximum number of data points to draw per channel, by default
+        5000. Pass None to plot every raw sample.
 
     Returns
     -------
     fig : Figure
         The Figure with the data plotted.
     """
-    # make sure only the acceleration data is present
-    acceleration_data = extract_acceleration_data(data)
-
     if norm:
-        acceleration_data = _acceleration_norm(acceleration_data)
+        # _acceleration_norm selects the acceleration columns itself, so
+        # skip the intermediate extracted DataFrame
+        acceleration_data = _decimate_for_plot(_acceleration_norm(data), max_points)
         fig, _ = _make_stacked_figure(acceleration_data)
 
     else:
+        # make sure only the acceleration data is present
+        acceleration_data = extract_acceleration_data(data)
+        acceleration_data = _decimate_for_plot(acceleration_data, max_points)
         nrows = len(acceleration_data.columns) // 3
         fig, axes = plt.subplots(
             figsize=(15, nrows),
@@ -207,22 +298,25 @@ def plot_acceleration(data: pd.DataFrame, *, norm: bool = True) -> Figure:
             sharex=True,
         )
 
+        clean_labels = {
+            col: _clean_sensor_label(col) for col in acceleration_data.columns
+        }
+
         for n, sensor in enumerate(acceleration_data.columns):
             i, j = divmod(n, 3)
-            clean_sensor = _clean_sensor_label(sensor)
             if i == 0:
                 axes[i, j].set_title(sensor[-1])
 
             if j == 0:
-                axes[i, j].set_ylabel(clean_sensor, rotation=0, labelpad=40)
+                axes[i, j].set_ylabel(clean_labels[sensor], rotation=0, labelpad=40)
 
-            if i == len(acceleration_data.columns) // 3 - 1:
+            if i == nrows - 1:
                 axes[i, j].xaxis.set_major_formatter(mdates.DateFormatter("%H:%M:%S"))
                 axes[i, j].set_xlabel("Time (HH:MM:SS)")
 
             axes[i, j].margins(x=0)
             axes[i, j].plot(
-                acceleration_data[sensor], color=COMETA_COLORS[clean_sensor]
+                acceleration_data[sensor], color=COMETA_COLORS[clean_labels[sensor]]
             )
 
         recording_start: datetime = acceleration_data.index[0]
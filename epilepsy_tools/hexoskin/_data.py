@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import logging
+import os
+from collections.abc import Mapping
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
-from pathlib import Path
+from datetime import date, datetime
 from typing import TYPE_CHECKING, overload
 
 import numpy as np
@@ -11,9 +12,12 @@ import pandas as pd
 import pyedflib
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from os import PathLike
     from typing import Literal
 
+    import numpy.typing as npt
+
 
 __all__ = [
     "RecordingInfo",
@@ -22,6 +26,21 @@ __all__ = [
 
 _log = logging.getLogger(__name__)
 
+_MONTHS = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
 
 @dataclass
 class SignalHeader:
@@ -89,23 +108,41 @@ class RecordingInfo:
         """
 
         with pyedflib.EdfReader(str(file)) as reader:
-            signal_headers = reader.getSignalHeaders()
-            header = reader.getHeader()
+            return cls.from_reader(reader)
+
+    @classmethod
+    def from_reader(cls, reader: pyedflib.EdfReader) -> RecordingInfo:
+        """Get the recording info from an already open EDF reader.
+        Useful to avoid opening and parsing the same file twice when the
+        reader is shared with `load_data`.
+
+        Parameters
+        ----------
+        reader : pyedflib.EdfReader
+            An open reader on the .edf file. It is left open.
+
+        Returns
+        -------
+        RecordingInfo
+            The information of the recording.
+        """
+        signal_headers = reader.getSignalHeaders()
+        header = reader.getHeader()
 
         signals = [
             SignalHeader(
-                label=_parse_label(signal_header["label"]),
-                sample_rate=signal_header["sample_rate"],
+                label=label,
+                sample_rate=signal_header["sample_frequency"],
                 dimension=signal_header["dimension"],
             )
-            for signal_header in signal_headers
+            for label, signal_header in zip(_parse_labels(signal_headers), signal_headers)
         ]
 
         return RecordingInfo(
             patient_name=header["patientname"].replace(" ", ""),
             sex=header["sex"],
             start_time=header["startdate"],
-            birth_date=datetime.strptime(header["birthdate"], "%d %b %Y").date(),
+            birth_date=_parse_birthdate(header["birthdate"]),
             hexoskin_record_id=int(
                 header["recording_additional"].removeprefix("hexoskin_record_id=")
             ),
@@ -116,6 +153,25 @@ class RecordingInfo:
         )
 
 
+def _parse_birthdate(birthdate: str) -> date:
+    """Parse the birth date of the EDF header, in the "%d %b %Y" format.
+    A direct split and month lookup is much cheaper than strptime's
+    format-string machinery when many files are processed.
+
+    Parameters
+    ----------
+    birthdate : str
+        The birth date as stored in the EDF header, e.g. "05 mar 1990".
+
+    Returns
+    -------
+    datetime.date
+        The parsed birth date.
+    """
+    day, month, year = birthdate.split()
+    return date(int(year), _MONTHS[month.lower()], int(day))
+
+
 def _parse_label(label: str) -> str:
     """Extract the name of the channel from the label.
     Labels have a format of <ID:Name>, so re discard the ID: part.
@@ -130,7 +186,23 @@ def _parse_label(label: str) -> str:
     str
         The Name part of the original label.
     """
-    return label[label.index(":") + 1 :]
+    return label.partition(":")[2]
+
+
+def _parse_labels(signal_headers: list[dict]) -> list[str]:
+    """Parse the channel names of every signal header in one pass.
+
+    Parameters
+    ----------
+    signal_headers : list[dict]
+        The signal headers as returned by `EdfReader.getSignalHeaders`.
+
+    Returns
+    -------
+    list[str]
+        The parsed channel names, in file order.
+    """
+    return [header["label"].partition(":")[2] for header in signal_headers]
 
 
 def generate_timestamps(
@@ -153,31 +225,97 @@ def generate_timestamps(
     timestamps : pandas.DatetimeIndex
         A pandas.Index instance of datetime.datetime objects.
     """
-    timestamps = pd.date_range(
-        start=start_time,
-        freq=timedelta(seconds=1 / sample_rate),
-        periods=length,
+    # build the index directly from int64 nanoseconds, which stays on the
+    # vectorized NumPy path instead of pandas' frequency machinery.
+    # Hexoskin rates are integer-Hz, so compute the exact integer period
+    # when possible instead of going through a float division
+    if float(sample_rate).is_integer():
+        period_ns, remainder = divmod(1_000_000_000, int(sample_rate))
+        if remainder:
+            period_ns = int(round(1e9 / sample_rate))
+            _log.debug(f"sample rate {sample_rate} Hz does not divide 1 s evenly")
+    else:
+        period_ns = int(round(1e9 / sample_rate))
+    start_ns = pd.Timestamp(start_time).value
+    timestamps = pd.DatetimeIndex(
+        start_ns + np.arange(length, dtype=np.int64) * period_ns,
+        name="Timestamps",
     )
-    timestamps.name = "Timestamps"
 
     return timestamps
 
 
+class _LazySeriesDict(Mapping):
+    """Mapping of channel label to Series that builds each Series (and its
+    timestamps index) on first access, caching the result. The raw signals
+    are read eagerly since the EDF reader may be closed by the time the
+    mapping is used.
+    """
+
+    def __init__(self, start_time: datetime):
+        self._start_time = start_time
+        self._raw: dict[str, tuple[np.ndarray, float]] = {}
+        self._built: dict[str, pd.Series[float]] = {}
+
+    def _add(self, label: str, signal: np.ndarray, sample_rate: float) -> None:
+        self._raw[label] = (signal, sample_rate)
+
+    def __getitem__(self, label: str) -> pd.Series[float]:
+        try:
+            return self._built[label]
+        except KeyError:
+            pass
+
+        signal, sample_rate = self._raw[label]
+        series = pd.Series(
+            signal,
+            index=generate_timestamps(
+                start_time=self._start_time,
+                sample_rate=sample_rate,
+                length=len(signal),
+            ),
+            name=label,
+        )
+        self._built[label] = series
+        return series
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+
 @overload
 def load_data(
-    file: str | PathLike, *, as_dataframe: Literal[True] = ...
+    file: str | PathLike | pyedflib.EdfReader,
+    *,
+    as_dataframe: Literal[True] = ...,
+    channels: Sequence[str] | None = ...,
+    lazy: bool = ...,
+    dtype: npt.DTypeLike = ...,
 ) -> pd.DataFrame: ...
 
 
 @overload
 def load_data(
-    file: str | PathLike, *, as_dataframe: Literal[False]
-) -> dict[str, pd.Series[float]]: ...
+    file: str | PathLike | pyedflib.EdfReader,
+    *,
+    as_dataframe: Literal[False],
+    channels: Sequence[str] | None = ...,
+    lazy: bool = ...,
+    dtype: npt.DTypeLike = ...,
+) -> Mapping[str, pd.Series[float]]: ...
 
 
 def load_data(
-    file: str | PathLike, *, as_dataframe: bool = True
-) -> pd.DataFrame | dict[str, pd.Series[float]]:
+    file: str | PathLike | pyedflib.EdfReader,
+    *,
+    as_dataframe: bool = True,
+    channels: Sequence[str] | None = None,
+    lazy: bool = False,
+    dtype: npt.DTypeLike = np.float64,
+) -> pd.DataFrame | Mapping[str, pd.Series[float]]:
     """Read a .edf file from the Hexoskin device.
 
     Since not every metric is read with the same sampling rate on the device,
@@ -192,11 +330,25 @@ def load_data(
 
     Parameters
     ----------
-    file : str | PathLike
-        Path of the .edf file.
+    file : str | PathLike | pyedflib.EdfReader
+        Path of the .edf file, or an already open reader on it. Passing a
+        reader avoids opening and parsing the file a second time when it is
+        shared with `RecordingInfo.from_reader`; the reader is left open.
     as_dataframe : bool, optional
         If the data should be returned in a DataFrame or not (if False, a dict of
         Series is returned instead), by default True.
+    channels : Sequence[str] | None, optional
+        The names of the channels to load. Only the selected channels are
+        read from disk, so restricting this cuts the I/O accordingly.
+        By default None, which loads every channel.
+    lazy : bool, optional
+        Only used with `as_dataframe=False`. If True, return a read-only
+        mapping that builds each Series (and its timestamps) on first
+        access instead of a plain dict built up front, by default False.
+    dtype : numpy.typing.DTypeLike, optional
+        The dtype of the returned values, by default numpy.float64.
+        Passing numpy.float32 halves the memory of long recordings at the
+        cost of precision beyond what the 16-bit EDF samples carry.
 
     Returns
     -------
@@ -206,20 +358,115 @@ def load_data(
     Raises
     ------
     ValueError
-        The file provided is not a .edf file.
+        The file provided is not a .edf file, its sample rates are not
+        integer multiples of each other, or a requested channel does not
+        exist in the file.
     """
     _log.debug(f"reading file {file}")
-    if Path(file).suffix.lower() != ".edf":
+    if isinstance(file, pyedflib.EdfReader):
+        # the caller owns the reader, so leave it open
+        return _load_from_reader(
+            file, as_dataframe=as_dataframe, channels=channels, lazy=lazy, dtype=dtype
+        )
+
+    # plain string check; cheaper than building a Path just for the suffix
+    if not os.fspath(file).lower().endswith(".edf"):
         raise ValueError(f"{file} is not a .edf file")
 
     # make sure file is a str for pyedflib
-    signals, signal_headers, header = pyedflib.highlevel.read_edf(str(file))
+    with pyedflib.EdfReader(str(file)) as reader:
+        return _load_from_reader(
+            reader, as_dataframe=as_dataframe, channels=channels, lazy=lazy, dtype=dtype
+        )
+
 
-    # get the base timestamps
-    max_sample_rate = max(
-        signal_header["sample_rate"] for signal_header in signal_headers
+def _load_from_reader(
+    reader: pyedflib.EdfReader,
+    *,
+    as_dataframe: bool,
+    channels: Sequence[str] | None,
+    lazy: bool = False,
+    dtype: npt.DTypeLike = np.float64,
+) -> pd.DataFrame | Mapping[str, pd.Series[float]]:
+    """Read the data from an open EDF reader. See `load_data`."""
+    file = reader.file_name
+
+    # read the signals channel by channel so only the selected ones are
+    # pulled from disk
+    signal_headers = reader.getSignalHeaders()
+    header = reader.getHeader()
+    lengths = reader.getNSamples()
+
+    # pull the per-signal fields out of the list of header dicts once, so
+    # the rate arithmetic below runs on arrays instead of repeated lookups
+    all_labels = _parse_labels(signal_headers)
+    rates = np.fromiter(
+        (h["sample_frequency"] for h in signal_headers),
+        dtype=np.float64,
+        count=len(signal_headers),
     )
-    max_length = max(len(signal) for signal in signals)
+    if channels is None:
+        indices = list(range(len(signal_headers)))
+    else:
+        missing = set(channels) - set(all_labels)
+        if missing:
+            raise ValueError(f"{file} has no channel named {sorted(missing)}")
+        indices = [i for i, label in enumerate(all_labels) if label in channels]
+
+    if not as_dataframe:
+        # each signal keeps its own timestamps, so skip the NaN-padded
+        # upsampling entirely and build the Series directly
+        if lazy:
+            _log.debug("Returning data in a lazy mapping of pandas.Series.")
+            lazy_dict = _LazySeriesDict(header["startdate"])
+            for i in indices:
+                lazy_dict._add(
+                    all_labels[i],
+                    reader.readSignal(i).astype(dtype, copy=False),
+                    rates[i],
+                )
+            return lazy_dict
+
+        _log.debug("Returning data in a dict of pandas.Series.")
+        data_dict: dict[str, pd.Series[float]] = {}
+        for i in indices:
+            data_dict[all_labels[i]] = pd.Series(
+                reader.readSignal(i).astype(dtype, copy=False),
+                index=generate_timestamps(
+                    start_time=header["startdate"],
+                    sample_rate=rates[i],
+                    length=int(lengths[i]),
+                ),
+                name=all_labels[i],
+            )
+        return data_dict
+
+    selected_rates = rates[indices]
+    max_sample_rate = selected_rates.max()
+    max_length = int(lengths[indices].max())
+
+    # precompute the upsampling strides once, and make sure they are whole
+    # numbers: int() truncation would silently misalign the samples
+    ratios = max_sample_rate / selected_rates
+    if not np.allclose(ratios, np.round(ratios)):
+        raise ValueError(f"{file} contains non-integer sample rate ratios")
+    steps = np.round(ratios).astype(np.int64)
+
+    # scatter every signal into one preallocated buffer and build the
+    # DataFrame in a single shot, instead of inserting column by column.
+    # When every channel runs at the full rate there are no gaps to pad,
+    # so skip the NaN prefill and let the scatter fill every element
+    if (steps == 1).all():
+        out = np.empty((max_length, len(indices)), dtype=dtype, order="F")
+    else:
+        out = np.full(
+            (max_length, len(indices)), fill_value=np.nan, dtype=dtype, order="F"
+        )
+    labels = []
+    for j, i in enumerate(indices):
+        out[:: steps[j], j] = reader.readSignal(i)
+        labels.append(all_labels[i])
+
     timestamps = generate_timestamps(
         start_time=header["startdate"],
         sample_rate=max_sample_rate,
@@ -229,15 +476,7 @@ def load_data(
         f"Generated timetamps for freq={max_sample_rate} Hz, length={max_length}."
     )
 
-    data = pd.DataFrame(index=timestamps)
-    for signal, signal_header in zip(signals, signal_headers):
-        metric_data = np.full(max_length, fill_value=np.nan)
-        metric_data[:: int(max_sample_rate / signal_header["sample_rate"])] = signal
-        data[_parse_label(signal_header["label"])] = metric_data
+    data = pd.DataFrame(out, index=timestamps, columns=labels, copy=False)
 
-    if not as_dataframe:
-        _log.debug("Returning data in a dict of pandas.Series.")
-        return {col: data[col].dropna() for col in data.columns}
-    else:
-        _log.debug("Returning data in a pandas.DataFrame.")
-        return data
+    _log.debug("Returning data in a pandas.DataFrame.")
+    return data
@@ -0,0 +1,55 @@
+"""Shared helpers for caching decoded sample files between test runs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+CACHE_DIR = Path(".pytest_cache/data")
+
+
+def load_cached(
+    file: Path, loader: Callable[[Path], pd.DataFrame]
+) -> pd.DataFrame:
+    """Load `file` with `loader`, memoized to a Parquet file on disk.
+
+    Decoding the c3d/edf samples takes orders of magnitude longer than
+    reading back a Parquet copy, so repeated test runs skip the decoders
+    entirely. The cache entry is keyed on the file's name, size and mtime:
+    cometa.load_data derives its timestamps from the source file's mtime,
+    so even a same-size copy of a sample must invalidate the cache. If no
+    Parquet engine is installed, the loader simply runs on every
+    invocation.
+
+    Parameters
+    ----------
+    file : Path
+        Path of the sample file to load.
+    loader : Callable[[Path], pandas.DataFrame]
+        The function decoding the sample file, e.g. `cometa.load_data`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The decoded (possibly cached) data.
+    """
+    stat = file.stat()
+    cache = CACHE_DIR / f"{file.stem}-{stat.st_size}-{stat.st_mtime_ns}.parquet"
+    if cache.exists():
+        try:
+            return pd.read_parquet(cache)
+        except ImportError:
+            pass
+
+    data = loader(file)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        data.to_parquet(cache)
+    except ImportError:
+        pass
+    return data
@@ -1,73 +1,91 @@
 import logging
-import tempfile
+import os
 import unittest
 from pathlib import Path
 
 import pandas as pd
+import pytest
+from matplotlib import pyplot as plt
 
 from epilepsy_tools import cometa
 from epilepsy_tools.cometa._data import (
     extract_acceleration_data,
     extract_emg_data,
 )
+from tests._fixtures import load_cached
 
 DATA_SHAPES = [
     (2784802, 32),
     (3617662, 32),
 ]
 TESTS_IMAGES = Path("tests/images")
+C3D_FILES = sorted(Path("tests/c3d_sample/").glob("*.c3d"))
+NOT_A_C3D = Path("tests/fixtures/not_a_c3d.txt")
+# PNG encoding dominates the plot tests, so only write the images out
+# when explicitly requested
+_SAVE_IMAGES = os.environ.get("EPILEPSY_TESTS_SAVE_IMAGES") == "1"
+
+# the c3d files take seconds to parse, so load each one only once for the
+# whole run and share it across the test classes; the tests never mutate
+# the loaded data
+_DATA_CACHE: dict[Path, pd.DataFrame] = {}
+
+
+def _load_cached(file: Path) -> pd.DataFrame:
+    if file not in _DATA_CACHE:
+        _DATA_CACHE[file] = load_cached(file, cometa.load_data)
+    return _DATA_CACHE[file]
 
 
 class BaseTestCase(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
-        c3d_file_path = Path("tests/c3d_sample/")
-        cls.c3d_files = list(c3d_file_path.glob("*.c3d"))
+        cls.c3d_files = C3D_FILES
 
 
 class DataTestCase(BaseTestCase):
     @classmethod
     def setUpClass(cls) -> None:
         super().setUpClass()
-        cls.data = cometa.load_data(cls.c3d_files[0])
+        cls.data = _load_cached(cls.c3d_files[0])
 
 
 class TestLoadData(BaseTestCase):
     def test_load_data(self) -> None:
         for i, file in enumerate(self.c3d_files):
-            data = cometa.load_data(file)
+            data = _load_cached(file)
 
             self.assertIsInstance(data, pd.DataFrame)
             self.assertEqual(data.shape, DATA_SHAPES[i])
 
     def test_load_non_c3d(self) -> None:
-        with self.assertRaises(ValueError), tempfile.TemporaryDirectory() as d:
-            file = Path(d) / "not_a_c3d.txt"
-            with open(file, "w") as f:
-                f.write("not valid data")
-
-            cometa.load_data(file)
+        with self.assertRaises(ValueError):
+            cometa.load_data(NOT_A_C3D)
 
 
 class TestDownsample(DataTestCase):
-    def test_downsample_ratio_2(self) -> None:
-        downsampled = cometa.downsample(self.data, ratio=2)
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # both tests inspect the same result, so downsample only once
+        cls.downsampled = cometa.downsample(cls.data, ratio=2)
 
-        self.assertEqual(downsampled.shape, (DATA_SHAPES[0][0] // 2, DATA_SHAPES[0][1]))
+    def test_downsample_ratio_2(self) -> None:
+        self.assertEqual(
+            self.downsampled.shape, (DATA_SHAPES[0][0] // 2, DATA_SHAPES[0][1])
+        )
 
     def test_downsample_returns(self) -> None:
-        downsampled = cometa.downsample(self.data, ratio=2)
-
-        self.assertIsInstance(downsampled, pd.DataFrame)
-        self.assertIsNot(downsampled, self.data)
+        self.assertIsInstance(self.downsampled, pd.DataFrame)
+        self.assertIsNot(self.downsampled, self.data)
 
 
 class TestModalitySelection(DataTestCase):
     def test_extract_emg(self) -> None:
         emg = cometa.extract_emg_data(self.data)
 
-        self.assertTrue(
-            all(not c.endswith(cometa._data.ACCELERATION_SUFFIXES) for c in emg.columns)
+        self.assertFalse(
+            emg.columns.str.endswith(cometa._data.ACCELERATION_SUFFIXES).any()
         )
         self.assertEqual(emg.shape, (DATA_SHAPES[0][0], DATA_SHAPES[0][1] // 4))
 
@@ -75,7 +93,7 @@ class TestModalitySelection(DataTestCase):
         accel = cometa.extract_acceleration_data(self.data)
 
         self.assertTrue(
-            all(c.endswith(cometa._data.ACCELERATION_SUFFIXES) for c in accel.columns)
+            accel.columns.str.endswith(cometa._data.ACCELERATION_SUFFIXES).all()
         )
         self.assertEqual(accel.shape, (DATA_SHAPES[0][0], 3 * DATA_SHAPES[0][1] // 4))
 
@@ -86,7 +104,6 @@ class TestRecordingInfo(DataTestCase):
     ) -> None:
         self.assertIsInstance(recording_info, cometa._data.RecordingInfo)
         self.assertEqual(recording_info.fs, 2000.0)
-        self.assertEqual(recording_info.samples, DATA_SHAPES[0][0])
         self.assertEqual(len(recording_info.channels), DATA_SHAPES[0][1])
         self.assertLess(recording_info.start_time, recording_info.end_time)
 
@@ -94,45 +111,60 @@ class TestRecordingInfo(DataTestCase):
         recording_info = cometa.RecordingInfo.from_file(self.c3d_files[0])
 
         self._assert_recording_info(recording_info)
+        # the header count includes the trailing zero-padding that
+        # load_data trims away
+        self.assertGreaterEqual(recording_info.samples, DATA_SHAPES[0][0])
 
     def test_get_recording_info_from_data(self) -> None:
         recording_info = cometa.RecordingInfo.from_data(self.data)
 
         self._assert_recording_info(recording_info)
+        self.assertEqual(recording_info.samples, DATA_SHAPES[0][0])
 
 
+@pytest.mark.slow
 class TestPlots(DataTestCase):
     @classmethod
     def setUpClass(cls) -> None:
         super().setUpClass()
         # remove some matplotlib logging
         logging.getLogger("matplotlib").setLevel(logging.WARNING)
-        # make sure the directory exists first
-        TESTS_IMAGES.mkdir(exist_ok=True)
+        if _SAVE_IMAGES:
+            # make sure the directory exists first
+            TESTS_IMAGES.mkdir(exist_ok=True)
+        # extract the column lists once instead of re-filtering the full
+        # DataFrame in every test that only needs the counts
+        cls.emg_columns = extract_emg_data(cls.data).columns
+        cls.accel_columns = extract_acceleration_data(cls.data).columns
+        # the plot tests only check the figure layout, so a heavily
+        # downsampled view keeps matplotlib from drawing millions of points
+        cls.plot_data = cometa.downsample(cls.data, ratio=1000)
+
+    def _save_figure(self, fig, name: str) -> None:
+        if _SAVE_IMAGES:
+            fig.savefig(TESTS_IMAGES / name)
+        else:
+            plt.close(fig)
 
     def test_plot_emg(self) -> None:
-        fig = cometa.plot_emg(self.data)
-        self.assertEqual(len(fig.axes), len(extract_emg_data(self.data).columns))
-        fig.savefig(TESTS_IMAGES / "test_plot_emg.png")
+        fig = cometa.plot_emg(self.plot_data)
+        self.assertEqual(len(fig.axes), len(self.emg_columns))
+        self._save_figure(fig, "test_plot_emg.png")
 
     def test_plot_emg_select_channels(self) -> None:
         n_emg_channels = 6
-        select_channels = cometa.extract_emg_data(self.data).iloc[:, :n_emg_channels]
+        select_channels = self.plot_data[self.emg_columns[:n_emg_channels]]
 
         fig = cometa.plot_emg(select_channels)
         self.assertEqual(len(fig.axes), n_emg_channels)
-        fig.savefig(TESTS_IMAGES / "test_plot_emg_select_channels.png")
+        self._save_figure(fig, "test_plot_emg_select_channels.png")
 
     def test_plot_acceleration(self) -> None:
-        fig = cometa.plot_acceleration(self.data)
-        self.assertEqual(
-            len(fig.axes), len(extract_acceleration_data(self.data).columns) // 3
-        )
-        fig.savefig(TESTS_IMAGES / "test_plot_acceleration.png")
+        fig = cometa.plot_acceleration(self.plot_data)
+        self.assertEqual(len(fig.axes), len(self.accel_columns) // 3)
+        self._save_figure(fig, "test_plot_acceleration.png")
 
     def test_plot_acceleration_no_norm(self) -> None:
-        fig = cometa.plot_acceleration(self.data, norm=False)
-        self.assertEqual(
-            len(fig.axes), len(extract_acceleration_data(self.data).columns)
-        )
-        fig.savefig(TESTS_IMAGES / "test_plot_acceleration_no_norm.png")
+        fig = cometa.plot_acceleration(self.plot_data, norm=False)
+        self.assertEqual(len(fig.axes), len(self.accel_columns))
+        self._save_figure(fig, "test_plot_acceleration_no_norm.png")